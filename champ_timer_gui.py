@@ -10,12 +10,47 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import serial
 import serial.tools.list_ports
+import bisect
 import csv
 import datetime
+import heapq
+import math
+import os
+import queue
+import re
+import sys
 import threading
-import time
 from pathlib import Path
 
+# Lane times as emitted by the timer, e.g. "1.2345"
+_TIME_RE = re.compile(rb'(\d+\.?\d{4})')
+_DIGITS = b'0123456789'
+
+# Results/standings display text
+_SEP = '=' * 60
+_WINNER_TAG = " 🏆 HEAT WINNER!"
+_MEDALS = ("", "🥇 ", "🥈 ", "🥉 ")  # indexed by rank
+
+def _split_times(data_line):
+    """Times from a plain whitespace-separated line; ValueError if decorated
+    
+    Only accepts what _TIME_RE would: tokens of digits with exactly 4
+    decimals are times, short undotted tokens (e.g. a heat number) are
+    skipped, anything else raises so the caller falls back to the regex.
+    """
+    times = []
+    for tok in data_line.split():
+        int_part, dot, frac = tok.partition(b'.')
+        if dot and int_part.isdigit() and frac.isdigit() and len(frac) == 4:
+            times.append(float(tok))
+        elif dot or len(tok) - len(tok.translate(None, _DIGITS)) >= 5:
+            raise ValueError(f"not a plain timer token: {tok!r}")
+    return times
+
+def _regex_times(data_line):
+    """Times from any line layout, e.g. 'A=1.2345! B=2.3456"'"""
+    return [float(match) for match in _TIME_RE.findall(data_line)]
+
 class TournamentGUI:
     def __init__(self, root):
         self.root = root
@@ -26,9 +61,20 @@ class TournamentGUI:
         self.serial_port = None
         self.is_connected = False
         self.is_listening = False
+        self._parse = self._parse_detect  # switched to a specialised parser once the format is known
         self.heat_number = 1
         self.competitors = {}
-        self.current_heat_assignments = {}
+        self._ranking = []  # (best_time or inf, roster seq, name), kept sorted
+        self._roster_seq = {}  # name -> order added; ties keep roster order
+        self._next_seq = 0
+        
+        # Standings rows, updated in place: name -> iid, display order, shown values
+        self._tree_iid = {}
+        self._tree_order = []
+        self._tree_values = {}
+        self._names_cache = None  # lane dropdown values, rebuilt on add/remove
+        self.current_heat_assignments = [None, None, None, None]  # name per lane, index = lane - 1
+        self._lane_prefixes = []  # "Lane N - <name>: " results lines for the current heat
         
         # File setup
         self.results_dir = Path("race_results")
@@ -36,10 +82,23 @@ class TournamentGUI:
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         self.heats_file = self.results_dir / f"heats_{timestamp}.csv"
         self.standings_file = self.results_dir / f"standings_{timestamp}.csv"
+        self._heats_fp = None
+        self._heats_writer = None
+        self._standings_dirty = False
+        
+        # Calls from worker threads, run on the Tk thread by _drain_ui_queue
+        self._ui_queue = queue.Queue()
+        
+        # ('heat', row) / ('standings', rows) jobs, written to disk by a background thread
+        self._io_queue = queue.Queue()
+        self._io_thread = threading.Thread(target=self._io_worker, daemon=True)
+        self._io_thread.start()
         
         # Setup UI
         self.setup_ui()
         self.show_setup_tab()
+        self.root.protocol('WM_DELETE_WINDOW', self.on_close)
+        self.root.after(50, self._drain_ui_queue)
         
     def setup_ui(self):
         """Create the user interface"""
@@ -265,7 +324,7 @@ class TournamentGUI:
         
         # Refresh button
         refresh_btn = tk.Button(self.standings_frame, text="🔄 Refresh Standings", 
-                               command=self.update_standings_display,
+                               command=self.refresh_standings,
                                bg='#3498db', fg='white', font=('Arial', 12, 'bold'),
                                padx=30, pady=10)
         refresh_btn.pack(pady=20)
@@ -289,6 +348,13 @@ class TournamentGUI:
             'total_time': 0.0,
             'races_count': 0
         }
+        self._roster_seq[name] = self._next_seq
+        self._next_seq += 1
+        bisect.insort(self._ranking, self._rank_key(name, None))
+        self._tree_iid[name] = self.standings_tree.insert('', tk.END)
+        self._tree_order.append(name)
+        self._tree_values[name] = None
+        self._names_cache = None
         
         self.competitor_listbox.insert(tk.END, name)
         self.competitor_entry.delete(0, tk.END)
@@ -305,7 +371,13 @@ class TournamentGUI:
         name = self.competitor_listbox.get(idx)
         
         if messagebox.askyesno("Confirm", f"Remove {name} from the tournament?"):
-            del self.competitors[name]
+            best_time = self.competitors.pop(name)['best_time']
+            self._unrank(name, best_time)
+            del self._roster_seq[name]
+            self.standings_tree.delete(self._tree_iid.pop(name))
+            self._tree_order.remove(name)
+            del self._tree_values[name]
+            self._names_cache = None
             self.competitor_listbox.delete(idx)
     
     def finish_setup(self):
@@ -321,19 +393,28 @@ class TournamentGUI:
             self.notebook.tab(1, state='normal')
             self.show_connection_tab()
             
-            # Initialize CSV
-            with open(self.heats_file, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(['Heat #', 'Timestamp', 'Lane 1 Name', 'Lane 1 Time', 
-                               'Lane 2 Name', 'Lane 2 Time', 'Lane 3 Name', 'Lane 3 Time',
-                               'Lane 4 Name', 'Lane 4 Time', 'Heat Winner'])
+            # Initialize CSV - kept open for the whole session, flushed once per heat
+            if self._heats_fp is None:
+                self._heats_fp = open(self.heats_file, 'w', newline='', buffering=8192)
+                self._heats_writer = csv.writer(self._heats_fp)
+                self._heats_writer.writerow(['Heat #', 'Timestamp', 'Lane 1 Name', 'Lane 1 Time', 
+                                             'Lane 2 Name', 'Lane 2 Time', 'Lane 3 Name', 'Lane 3 Time',
+                                             'Lane 4 Name', 'Lane 4 Time', 'Heat Winner'])
+                self._heats_fp.flush()
     
     # Connection Tab Methods
     def refresh_ports(self):
-        """Refresh available serial ports"""
+        """Refresh available serial ports (enumerated in the background)"""
+        threading.Thread(target=self._enum_ports_worker, daemon=True).start()
+    
+    def _enum_ports_worker(self):
+        """Background thread - port enumeration can take a while on Windows"""
         ports = serial.tools.list_ports.comports()
         port_list = [f"{port.device} - {port.description}" for port in ports]
-        
+        self._ui_queue.put((self._apply_port_list, (port_list,)))
+    
+    def _apply_port_list(self, port_list):
+        """Show enumerated ports in the port dropdown"""
         if not port_list:
             port_list = ["No serial ports found"]
         
@@ -368,10 +449,19 @@ class TournamentGUI:
                 bytesize=serial.EIGHTBITS,
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE,
-                timeout=1
+                timeout=0.1
             )
             
+            # Larger driver receive buffer so bursts survive GUI stalls (Windows only)
+            if hasattr(self.serial_port, 'set_buffer_size'):
+                try:
+                    self.serial_port.set_buffer_size(rx_size=65536)
+                except Exception:
+                    pass
+            self._tune_latency(port_name)
+            
             self.is_connected = True
+            self._parse = self._parse_detect
             self.connection_status.config(text=f"✓ Connected to {port_name}", fg='green')
             self.connect_btn.config(text="Disconnect", bg='#e74c3c')
             self.next_to_race_btn.config(state='normal')
@@ -381,56 +471,79 @@ class TournamentGUI:
         except Exception as e:
             messagebox.showerror("Connection Error", f"Failed to connect:\n{str(e)}")
     
+    def _tune_latency(self, port_name):
+        """Drop the USB-serial latency timer to 1 ms where the OS exposes it"""
+        # FTDI-style adapters hold received bytes for up to 16 ms by default.
+        # Linux exposes the timer in sysfs (usually root-only); elsewhere it is
+        # a driver setting, so leave it alone.
+        if not sys.platform.startswith('linux'):
+            return
+        
+        latency_file = Path('/sys/bus/usb-serial/devices') / Path(port_name).name / 'latency_timer'
+        try:
+            latency_file.write_text('1')
+        except OSError:
+            pass
+    
     def go_to_racing(self):
         """Move to racing tab"""
         self.notebook.tab(2, state='normal')
         self.notebook.tab(3, state='normal')
         self.show_racing_tab()
         self.update_lane_options()
+        self.update_standings_display()
     
     # Racing Tab Methods
     def update_lane_options(self):
         """Update lane assignment dropdowns"""
-        options = ['(empty)'] + sorted(self.competitors.keys())
+        # Roster only changes during setup, so the sorted list is built once
+        if self._names_cache is None:
+            self._names_cache = ('(empty)',) + tuple(sorted(self.competitors))
+            for combo in self.lane_combos.values():
+                combo['values'] = self._names_cache
         
         for combo in self.lane_combos.values():
-            combo['values'] = options
             combo.set('(empty)')
     
     def auto_assign_lanes(self):
         """Automatically assign racers who have raced the least"""
-        # Sort competitors by race count
-        sorted_competitors = sorted(
-            self.competitors.items(),
+        # Pick the 4 lowest race counts without sorting the whole roster
+        # (same order as sorted(...)[:4], ties keep roster order)
+        next_racers = heapq.nsmallest(
+            4, self.competitors.items(),
             key=lambda x: x[1]['races_count']
         )
         
-        # Assign first 4
-        for lane, (name, _) in zip(range(1, 5), sorted_competitors[:4]):
+        for lane, (name, _) in zip(range(1, 5), next_racers):
             self.lane_combos[lane].set(name)
     
     def start_listening(self):
         """Start listening for race data"""
         # Get assignments
-        self.current_heat_assignments = {}
+        self.current_heat_assignments = [None, None, None, None]
         for lane, combo in self.lane_combos.items():
             selection = combo.get()
             if selection and selection != '(empty)':
-                self.current_heat_assignments[lane] = selection
+                self.current_heat_assignments[lane-1] = selection
         
-        if not self.current_heat_assignments:
+        if self.current_heat_assignments.count(None) == 4:
             messagebox.showwarning("No Assignments", 
                                  "Please assign at least one competitor to a lane.")
             return
         
         # Confirm
         assignment_text = "\n".join([f"Lane {lane}: {name}" 
-                                    for lane, name in self.current_heat_assignments.items()])
+                                    for lane, name in enumerate(self.current_heat_assignments, 1)
+                                    if name is not None])
         
         if not messagebox.askyesno("Ready to Race?", 
                                    f"Current assignments:\n\n{assignment_text}\n\nReady to race?"):
             return
         
+        # Results lines only vary by time once lanes are fixed
+        self._lane_prefixes = [f"Lane {lane} - {name or '---':20s}: "
+                               for lane, name in enumerate(self.current_heat_assignments, 1)]
+        
         # Disable button and start listening
         self.race_btn.config(state='disabled', text="⏳ Waiting for race data...")
         self.is_listening = True
@@ -441,91 +554,131 @@ class TournamentGUI:
     
     def listen_for_race(self):
         """Listen for race data in background thread"""
-        buffer = ""
+        buffer = bytearray()
         
         try:
+            # Discard anything the timer sent since the last heat (e.g. re-transmits)
+            # so it is not mistaken for this heat's result
+            if self.is_connected:
+                self.serial_port.reset_input_buffer()
+            
             while self.is_listening and self.is_connected:
-                if self.serial_port.in_waiting > 0:
-                    chunk = self.serial_port.read(self.serial_port.in_waiting).decode('utf-8', errors='ignore')
-                    buffer += chunk
+                # Block for the first byte (up to the port timeout), then
+                # drain everything the driver has buffered in one call
+                chunk = self.serial_port.read(self.serial_port.in_waiting or 1)
+                if not chunk:
+                    continue
+                
+                buffer.extend(chunk)
+                if b'\n' not in buffer and b'\r' not in buffer:
+                    continue
+                
+                # Frame all complete lines at once; keep the partial tail
+                lines = buffer.replace(b'\r', b'\n').split(b'\n')
+                buffer = bytearray(lines.pop())
+                
+                for line in lines:
+                    line = line.strip()
                     
-                    while '\n' in buffer or '\r' in buffer:
-                        if '\n' in buffer:
-                            line, buffer = buffer.split('\n', 1)
-                        else:
-                            line, buffer = buffer.split('\r', 1)
-                        
-                        line = line.strip()
+                    if line:
+                        times, winner_lane = self.parse_timer_data(line)
                         
-                        if line:
-                            times = self.parse_timer_data(line)
-                            
-                            if any(t is not None for t in times):
-                                # Process race results
-                                self.root.after(0, self.process_race_results, times)
-                                self.is_listening = False
-                                return
-                
-                time.sleep(0.01)
+                        if winner_lane is not None:
+                            # Process race results, stamped when the line arrived
+                            now = datetime.datetime.now()
+                            self._ui_queue.put((self.process_race_results, (times, winner_lane, now)))
+                            self.is_listening = False
+                            return
                 
         except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Listening Error", str(e)))
+            self._ui_queue.put((messagebox.showerror, ("Listening Error", str(e))))
             self.is_listening = False
-            self.root.after(0, lambda: self.race_btn.config(state='normal', text="🏁 READY TO RACE!"))
+            self._ui_queue.put((lambda: self.race_btn.config(state='normal', text="🏁 READY TO RACE!"), ()))
     
-    def parse_timer_data(self, data_line):
-        """Parse timer data"""
-        times = [None, None, None, None]
-        
+    def _drain_ui_queue(self):
+        """Run calls queued by worker threads, then check again shortly"""
         try:
-            import re
-            time_pattern = r'(\d+\.?\d{4})'
-            matches = re.findall(time_pattern, data_line)
-            
-            for i, match in enumerate(matches[:4]):
-                times[i] = float(match)
-            
-        except Exception:
+            while True:
+                func, args = self._ui_queue.get_nowait()
+                try:
+                    func(*args)
+                except Exception:
+                    # Report like a normal Tk callback and keep draining
+                    self.root.report_callback_exception(*sys.exc_info())
+        except queue.Empty:
             pass
-        
-        return times
+        finally:
+            self.root.after(50, self._drain_ui_queue)
     
-    def process_race_results(self, times):
-        """Process and display race results"""
-        # Find winner
+    def parse_timer_data(self, data_line):
+        """Parse timer data (raw bytes line from the serial port)
+        
+        Returns the 4 lane times and the winning lane (None if no times)
+        """
+        times = [None, None, None, None]
         winner_lane = None
-        winner_time = None
-        valid_times = [(i+1, t) for i, t in enumerate(times) if t is not None]
         
-        if valid_times:
-            winner_lane, winner_time = min(valid_times, key=lambda x: x[1])
+        # A time has at least 5 digits; skip banners/status chatter without parsing
+        if len(data_line) - len(data_line.translate(None, _DIGITS)) < 5:
+            return times, winner_lane
+        
+        # Track the fastest lane while filling in times
+        for i, value in enumerate(self._parse(data_line)[:4]):
+            times[i] = value
+            if winner_lane is None or value < times[winner_lane-1]:
+                winner_lane = i + 1
         
-        # Display results
-        results = f"\n{'='*60}\n"
-        results += f"HEAT #{self.heat_number} RESULTS - {datetime.datetime.now().strftime('%H:%M:%S')}\n"
-        results += f"{'='*60}\n\n"
+        return times, winner_lane
+    
+    def _parse_detect(self, data_line):
+        """Parse with the regex and pick the parser for the rest of the session"""
+        values = _regex_times(data_line)
+        
+        if values:
+            # Plain lines that split into exactly the same times skip the regex from now on
+            try:
+                plain = _split_times(data_line) == values
+            except ValueError:
+                plain = False
+            self._parse = self._parse_fast if plain else _regex_times
+        
+        return values
+    
+    def _parse_fast(self, data_line):
+        """Parse a plain timer line without the regex"""
+        try:
+            return _split_times(data_line)
+        except ValueError:
+            # Not the format we detected - re-detect on this line
+            return self._parse_detect(data_line)
+    
+    def process_race_results(self, times, winner_lane, now):
+        """Process and display race results"""
+        # Display results (collect lines, join once)
+        parts = ["", _SEP, f"HEAT #{self.heat_number} RESULTS - {now.strftime('%H:%M:%S')}",
+                 _SEP, ""]
         
         for lane in range(1, 5):
-            competitor = self.current_heat_assignments.get(lane, "---")
+            prefix = self._lane_prefixes[lane-1]
             time_val = times[lane-1]
             
             if time_val is not None:
-                winner_mark = " 🏆 HEAT WINNER!" if lane == winner_lane else ""
-                results += f"Lane {lane} - {competitor:20s}: {time_val:.4f}s{winner_mark}\n"
+                winner_mark = _WINNER_TAG if lane == winner_lane else ""
+                parts.append(f"{prefix}{time_val:.4f}s{winner_mark}")
             else:
-                results += f"Lane {lane} - {competitor:20s}: ---\n"
+                parts.append(prefix + "---")
         
-        results += f"\n{'='*60}\n"
+        parts += ["", _SEP, ""]
+        results = "\n".join(parts)
         
         self.results_text.config(state='normal')
-        self.results_text.delete('1.0', tk.END)
-        self.results_text.insert('1.0', results)
+        self.results_text.replace('1.0', tk.END, results)
         self.results_text.config(state='disabled')
         
         # Update stats
         for lane in range(1, 5):
-            if lane in self.current_heat_assignments and times[lane-1] is not None:
-                competitor = self.current_heat_assignments[lane]
+            competitor = self.current_heat_assignments[lane-1]
+            if competitor is not None and times[lane-1] is not None:
                 time_val = times[lane-1]
                 
                 self.competitors[competitor]['heats'].append({
@@ -535,17 +688,23 @@ class TournamentGUI:
                 })
                 self.competitors[competitor]['races_count'] += 1
                 self.competitors[competitor]['total_time'] += time_val
+                self._standings_dirty = True
                 
-                if (self.competitors[competitor]['best_time'] is None or 
-                    time_val < self.competitors[competitor]['best_time']):
+                best_time = self.competitors[competitor]['best_time']
+                if best_time is None or time_val < best_time:
                     self.competitors[competitor]['best_time'] = time_val
+                    
+                    # Re-rank only the competitor whose best time changed
+                    self._unrank(competitor, best_time)
+                    bisect.insort(self._ranking, self._rank_key(competitor, time_val))
         
         # Save to CSV
-        self.save_heat_results(times, winner_lane)
+        self.save_heat_results(times, winner_lane, now)
         
-        # Update standings
+        # Update standings (CSV is written in the background, only if a time was recorded)
         self.update_standings_display()
-        self.save_standings()
+        if self._standings_dirty:
+            self.save_standings()
         
         # Increment heat
         self.heat_number += 1
@@ -560,46 +719,48 @@ class TournamentGUI:
         # Show success
         messagebox.showinfo("Race Complete", "Heat results recorded!\n\nReady for next heat.")
     
-    def save_heat_results(self, times, winner_lane):
-        """Save heat results to CSV"""
-        try:
-            with open(self.heats_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                
-                row = [self.heat_number - 1, timestamp]
-                
-                for lane in range(1, 5):
-                    competitor = self.current_heat_assignments.get(lane, "")
-                    time_val = times[lane-1] if times[lane-1] is not None else ""
-                    row.extend([competitor, time_val])
-                
-                if winner_lane:
-                    winner_name = self.current_heat_assignments.get(winner_lane, "")
-                    row.append(winner_name)
-                else:
-                    row.append("")
-                
-                writer.writerow(row)
-                
-        except Exception as e:
-            messagebox.showerror("Save Error", f"Error saving heat results:\n{str(e)}")
+    def save_heat_results(self, times, winner_lane, now):
+        """Queue the heat's results row to be saved to CSV"""
+        timestamp = now.strftime('%Y-%m-%d %H:%M:%S')
+        
+        names = [competitor or "" for competitor in self.current_heat_assignments]
+        lane_times = [time_val if time_val is not None else "" for time_val in times]
+        winner_name = names[winner_lane-1] if winner_lane else ""
+        
+        # Fixed 4-lane layout, same column order as the header in finish_setup
+        row = [self.heat_number - 1, timestamp,
+               names[0], lane_times[0], names[1], lane_times[1],
+               names[2], lane_times[2], names[3], lane_times[3],
+               winner_name]
+        
+        self._io_queue.put(('heat', row))
+    
+    def _rank_key(self, name, best_time):
+        """Ranking entry - untimed racers last, ties in the order they were added"""
+        return (best_time if best_time is not None else math.inf, self._roster_seq[name], name)
+    
+    def _unrank(self, name, best_time):
+        """Drop a competitor's entry from the ranking (binary search, no scan)"""
+        del self._ranking[bisect.bisect_left(self._ranking, self._rank_key(name, best_time))]
     
     # Standings Tab Methods
+    def refresh_standings(self):
+        """Refresh standings display and write any pending changes to CSV"""
+        self.update_standings_display()
+        if self._standings_dirty:
+            self.save_standings()
+    
     def update_standings_display(self):
         """Update standings display"""
-        # Clear existing
-        for item in self.standings_tree.get_children():
-            self.standings_tree.delete(item)
-        
-        # Sort by best time
-        sorted_competitors = sorted(
-            self.competitors.items(),
-            key=lambda x: x[1]['best_time'] if x[1]['best_time'] is not None else 999.0
-        )
-        
-        # Add rows
-        for rank, (name, stats) in enumerate(sorted_competitors, 1):
+        # Rows are updated in place; only rows that moved or changed touch the widget
+        for rank, (_, _, name) in enumerate(self._ranking, 1):
+            iid = self._tree_iid[name]
+            if self._tree_order[rank-1] != name:
+                self.standings_tree.move(iid, '', rank-1)
+                self._tree_order.remove(name)
+                self._tree_order.insert(rank-1, name)
+            
+            stats = self.competitors[name]
             best = f"{stats['best_time']:.4f}s" if stats['best_time'] else "---"
             
             if stats['races_count'] > 0:
@@ -608,42 +769,110 @@ class TournamentGUI:
             else:
                 avg_str = "---"
             
-            medal = ""
-            if rank == 1 and stats['best_time']:
-                medal = "🥇 "
-            elif rank == 2 and stats['best_time']:
-                medal = "🥈 "
-            elif rank == 3 and stats['best_time']:
-                medal = "🥉 "
+            medal = _MEDALS[rank] if rank < len(_MEDALS) and stats['best_time'] else ""
             
-            self.standings_tree.insert('', tk.END, 
-                                      values=(f"{medal}{rank}", name, best, avg_str, 
-                                             stats['races_count']))
+            values = (f"{medal}{rank}", name, best, avg_str, stats['races_count'])
+            if self._tree_values[name] != values:
+                self.standings_tree.item(iid, values=values)
+                self._tree_values[name] = values
     
     def save_standings(self):
-        """Save standings to CSV"""
-        try:
-            sorted_competitors = sorted(
-                self.competitors.items(),
-                key=lambda x: x[1]['best_time'] if x[1]['best_time'] is not None else 999.0
-            )
+        """Queue a snapshot of the standings to be saved to CSV"""
+        rows = []
+        for rank, (_, _, name) in enumerate(self._ranking, 1):
+            stats = self.competitors[name]
+            best = stats['best_time'] if stats['best_time'] else ''
             
-            with open(self.standings_file, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(['Rank', 'Name', 'Best Time', 'Average Time', 'Total Races'])
-                
-                for rank, (name, stats) in enumerate(sorted_competitors, 1):
-                    best = stats['best_time'] if stats['best_time'] else ''
-                    
-                    if stats['races_count'] > 0:
-                        avg = stats['total_time'] / stats['races_count']
-                    else:
-                        avg = ''
+            if stats['races_count'] > 0:
+                avg = stats['total_time'] / stats['races_count']
+            else:
+                avg = ''
+            
+            rows.append([rank, name, best, avg, stats['races_count']])
+        
+        self._io_queue.put(('standings', rows))
+        self._standings_dirty = False
+    
+    def _io_worker(self):
+        """Background thread - write queued heat rows and standings snapshots"""
+        # One handle for the session; each save rewinds and truncates it
+        standings_fp = None
+        
+        while True:
+            jobs = [self._io_queue.get()]
+            while not self._io_queue.empty():
+                jobs.append(self._io_queue.get_nowait())
+            stop = None in jobs
+            
+            # Every heat row is appended in order; of the standings snapshots
+            # only the newest pending one is worth writing
+            heat_rows = []
+            rows = None
+            for job in jobs:
+                if job is None:
+                    continue
+                kind, data = job
+                if kind == 'heat':
+                    heat_rows.append(data)
+                else:
+                    rows = data
+            
+            if heat_rows:
+                try:
+                    self._heats_writer.writerows(heat_rows)
+                    self._heats_fp.flush()
+                except Exception as e:
+                    self._ui_queue.put((messagebox.showerror,
+                                        ("Save Error", f"Error saving heat results:\n{str(e)}")))
+            
+            if rows is not None:
+                try:
+                    if standings_fp is None:
+                        standings_fp = open(self.standings_file, 'w', newline='')
+                        writer = csv.writer(standings_fp)
                     
-                    writer.writerow([rank, name, best, avg, stats['races_count']])
+                    standings_fp.seek(0)
+                    standings_fp.truncate()
+                    writer.writerow(['Rank', 'Name', 'Best Time', 'Average Time', 'Total Races'])
+                    writer.writerows(rows)
+                    standings_fp.flush()
                     
-        except Exception as e:
-            pass  # Silent fail for background saves
+                except Exception:
+                    pass  # Silent fail for background saves
+            
+            if stop:
+                if standings_fp is not None:
+                    standings_fp.close()
+                return
+    
+    def on_close(self):
+        """Flush results to disk and exit"""
+        self.is_listening = False
+        
+        try:
+            if self._standings_dirty:
+                self.save_standings()
+            
+            # Let the writer finish any pending heat rows and standings before exiting
+            self._io_queue.put(None)
+            self._io_thread.join(timeout=5)
+            
+            # A writer still busy after the timeout owns the heats file - leave it alone
+            if self._heats_fp is not None and not self._io_thread.is_alive():
+                try:
+                    self._heats_fp.flush()
+                    os.fsync(self._heats_fp.fileno())
+                    self._heats_fp.close()
+                except OSError:
+                    pass  # e.g. results drive removed or full; still let the window close
+            
+            if self.serial_port and self.serial_port.is_open:
+                try:
+                    self.serial_port.close()
+                except (serial.SerialException, OSError):
+                    pass
+        finally:
+            self.root.destroy()
     
     # Navigation
     def show_setup_tab(self):